@@ -257,5 +257,4 @@ class MembraneChannel1DBlockData(MembraneChannelMixin, ControlVolume1DBlockData)
                     iscale.set_scaling_factor(v, 1e-4)
 
         if hasattr(self, "dP_dx"):
-            for v in self.pressure_dx.values():
-                iscale.set_scaling_factor(v, 1e-5)
+            iscale.set_scaling_factor(self.pressure_dx, 1e-5)
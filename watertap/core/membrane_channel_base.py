@@ -437,12 +437,10 @@ class MembraneChannelMixin:
             doc="Isothermal assumption for feed channel",
         )
         def eq_feed_isothermal(b, t, x):
-            if x == b.length_domain.first():
+            x_in = b.length_domain.first()
+            if x == x_in:
                 return Constraint.Skip
-            return (
-                b.properties[t, b.length_domain.first()].temperature
-                == b.properties[t, x].temperature
-            )
+            return b.properties[t, x_in].temperature == b.properties[t, x].temperature
 
     def add_extensive_flow_to_interface(self):
         # VOLUMETRIC FLOWRATE
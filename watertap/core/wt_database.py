@@ -17,6 +17,13 @@ import os
 import yaml
 from copy import deepcopy
 
+# Use the libyaml-backed loader when PyYAML was built with it; it parses the
+# same documents as the pure-Python loader, only faster.
+try:
+    from yaml import CLoader as _YamlLoader
+except ImportError:
+    from yaml import Loader as _YamlLoader
+
 
 class Database:
     """
@@ -81,7 +88,7 @@ class Database:
             except OSError:
                 raise KeyError("Could not find water_sources.yaml in database.")
 
-            source_data = yaml.load(lines, yaml.Loader)
+            source_data = yaml.load(lines, _YamlLoader)
 
             # Store data in cache and return
             self._cached_files["water_sources"] = source_data
@@ -203,7 +210,7 @@ class Database:
             except OSError:
                 raise KeyError(f"Could not find entry for {technology} in database.")
 
-            fdata = yaml.load(lines, yaml.Loader)
+            fdata = yaml.load(lines, _YamlLoader)
 
             # Store data in cache and return
             self._cached_files[technology] = fdata
@@ -224,4 +231,4 @@ class Database:
         except OSError:
             raise KeyError("Could not find component_list.yaml in database.")
 
-        self._component_list = yaml.load(lines, yaml.Loader)
+        self._component_list = yaml.load(lines, _YamlLoader)
@@ -43,6 +43,9 @@ from watertap.unit_models.pressure_changer import Pump, EnergyRecoveryDevice
 from watertap.core.util.initialization import assert_degrees_of_freedom
 from watertap.costing import WaterTAPCosting
 
+# components of the NaCl property package, copied onto the RO inlet during setup
+_COMPONENTS = ("H2O", "NaCl")
+
 
 class ERDtype(StrEnum):
     pressure_exchanger = "pressure_exchanger"
@@ -266,12 +269,10 @@ def set_operating_conditions(
     m.fs.RO.permeate.pressure[0].fix(101325)  # atmospheric pressure [Pa]
     m.fs.RO.width.fix(5)  # stage width [m]
     # initialize RO
-    m.fs.RO.feed_side.properties_in[0].flow_mass_phase_comp["Liq", "H2O"] = value(
-        m.fs.feed.properties[0].flow_mass_phase_comp["Liq", "H2O"]
-    )
-    m.fs.RO.feed_side.properties_in[0].flow_mass_phase_comp["Liq", "NaCl"] = value(
-        m.fs.feed.properties[0].flow_mass_phase_comp["Liq", "NaCl"]
-    )
+    for j in _COMPONENTS:
+        m.fs.RO.feed_side.properties_in[0].flow_mass_phase_comp["Liq", j] = value(
+            m.fs.feed.properties[0].flow_mass_phase_comp["Liq", j]
+        )
     m.fs.RO.feed_side.properties_in[0].temperature = value(
         m.fs.feed.properties[0].temperature
     )
@@ -336,6 +337,8 @@ def calculate_operating_pressure(
                         (default=0.01)
         solver:     solver object to be used (default=None)
     """
+    if solver is None:
+        solver = get_solver()
     t = ConcreteModel()  # create temporary model
     prop = feed_state_block.config.parameters
     t.brine = prop.build_state_block([0])
@@ -411,6 +414,7 @@ def initialize_pressure_exchanger(m, optarg):
         optarg=optarg
     )  # initialize inlet state block to solve for mass fraction
     # splitter outlet to PXR, enforce same volumetric flow as PXR high pressure inlet
+    mixed_state = m.fs.S1.mixed_state[0]
     m.fs.S1.PXR_state.calculate_state(
         var_args={
             (
@@ -420,22 +424,17 @@ def initialize_pressure_exchanger(m, optarg):
                 m.fs.PXR.brine_side.properties_in[0].flow_vol_phase["Liq"]
             ),
             ("mass_frac_phase_comp", ("Liq", "NaCl")): value(
-                m.fs.S1.mixed_state[0].mass_frac_phase_comp["Liq", "NaCl"]
+                mixed_state.mass_frac_phase_comp["Liq", "NaCl"]
             ),  # same as splitter inlet
-            ("pressure", None): value(
-                m.fs.S1.mixed_state[0].pressure
-            ),  # same as splitter inlet
-            ("temperature", None): value(m.fs.S1.mixed_state[0].temperature),
+            ("pressure", None): value(mixed_state.pressure),  # same as splitter inlet
+            ("temperature", None): value(mixed_state.temperature),
         },  # same as splitter inlet
     )
     # splitter initialization
-    m.fs.S1.PXR_state[0].flow_mass_phase_comp[
-        "Liq", "NaCl"
-    ].fix()  # fix the single degree of freedom for unit
+    split_flow_NaCl = m.fs.S1.PXR_state[0].flow_mass_phase_comp["Liq", "NaCl"]
+    split_flow_NaCl.fix()  # fix the single degree of freedom for unit
     m.fs.S1.initialize(optarg=optarg)
-    m.fs.S1.PXR_state[0].flow_mass_phase_comp[
-        "Liq", "NaCl"
-    ].unfix()  # unfix for flowsheet simulation and optimization
+    split_flow_NaCl.unfix()  # unfix for flowsheet simulation and optimization
 
     # pressure exchanger low pressure inlet
     propagate_state(m.fs.s08)
@@ -449,11 +448,10 @@ def initialize_pressure_exchanger(m, optarg):
 
     # ---initialize pump 2---
     propagate_state(m.fs.s09)
-    m.fs.P2.control_volume.properties_out[0].pressure.fix(
-        value(m.fs.P2.control_volume.properties_out[0].pressure)
-    )
+    P2_pressure_out = m.fs.P2.control_volume.properties_out[0].pressure
+    P2_pressure_out.fix()  # hold the current outlet pressure during initialization
     m.fs.P2.initialize(optarg=optarg)
-    m.fs.P2.control_volume.properties_out[0].pressure.unfix()
+    P2_pressure_out.unfix()
 
     # ---initialize mixer---
     propagate_state(m.fs.s03)
@@ -529,16 +527,18 @@ def optimize(m, solver=None, check_termination=True):
 
 def display_system(m):
     print("---system metrics---")
-    feed_flow_mass = sum(
-        m.fs.feed.flow_mass_phase_comp[0, "Liq", j].value for j in ["H2O", "NaCl"]
+    feed_flow_mass = (
+        m.fs.feed.flow_mass_phase_comp[0, "Liq", "H2O"].value
+        + m.fs.feed.flow_mass_phase_comp[0, "Liq", "NaCl"].value
     )
     feed_mass_frac_NaCl = (
         m.fs.feed.flow_mass_phase_comp[0, "Liq", "NaCl"].value / feed_flow_mass
     )
     print("Feed: %.2f kg/s, %.0f ppm" % (feed_flow_mass, feed_mass_frac_NaCl * 1e6))
 
-    prod_flow_mass = sum(
-        m.fs.product.flow_mass_phase_comp[0, "Liq", j].value for j in ["H2O", "NaCl"]
+    prod_flow_mass = (
+        m.fs.product.flow_mass_phase_comp[0, "Liq", "H2O"].value
+        + m.fs.product.flow_mass_phase_comp[0, "Liq", "NaCl"].value
     )
     prod_mass_frac_NaCl = (
         m.fs.product.flow_mass_phase_comp[0, "Liq", "NaCl"].value / prod_flow_mass
@@ -601,8 +601,9 @@ def display_state(m):
     print("---state---")
 
     def print_state(s, b):
-        flow_mass = sum(
-            b.flow_mass_phase_comp[0, "Liq", j].value for j in ["H2O", "NaCl"]
+        flow_mass = (
+            b.flow_mass_phase_comp[0, "Liq", "H2O"].value
+            + b.flow_mass_phase_comp[0, "Liq", "NaCl"].value
         )
         mass_frac_ppm = b.flow_mass_phase_comp[0, "Liq", "NaCl"].value / flow_mass * 1e6
         pressure_bar = b.pressure[0].value / 1e5
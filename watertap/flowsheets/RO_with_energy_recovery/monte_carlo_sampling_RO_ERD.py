@@ -63,9 +63,11 @@ def get_sweep_params(m, num_samples, use_LHS=False):
 def build_model(
     read_model_defauls_from_file=False,
     defaults_fname="default_configuration.yaml",
+    solver=None,
 ):
     # Set up the solver
-    solver = get_solver()
+    if solver is None:
+        solver = get_solver()
 
     # Build, set, and initialize the system (these steps will change depending on the underlying model)
     m = build()
@@ -111,8 +113,9 @@ def run_parameter_sweep(
     read_sweep_params_from_file=False,
     read_model_defauls_from_file=False,
     defaults_fname="default_configuration.yaml",
+    num_procs=1,
 ):
-    # Set up the solver
+    # Set up the solver, shared by the model build and every sweep sample
     solver = get_solver()
 
     # Run the parameter sweep study using num_samples randomly drawn from the above range
@@ -132,6 +135,7 @@ def run_parameter_sweep(
         build_model_kwargs=dict(
             read_model_defauls_from_file=read_model_defauls_from_file,
             defaults_fname=defaults_fname,
+            solver=solver,
         ),
         build_sweep_params_kwargs=dict(
             num_samples=num_samples,
@@ -139,7 +143,7 @@ def run_parameter_sweep(
             sweep_params_fname=sweep_params_fname,
             read_sweep_params_from_file=read_sweep_params_from_file,
         ),
-        number_of_subprocesses=1,
+        number_of_subprocesses=num_procs,
     )
 
     return global_results_arr
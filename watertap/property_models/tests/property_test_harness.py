@@ -39,6 +39,8 @@ from idaes.core.util.scaling import (
 from idaes.core.util.initialization import fix_state_vars
 from watertap.core.solvers import get_solver
 
+solver = get_solver()
+
 
 # -----------------------------------------------------------------------------
 class PropertyAttributeError(AttributeError):
@@ -166,59 +168,61 @@ class PropertyTestHarness:
     def test_on_demand_properties(self, frame_stateblock):
         m = frame_stateblock
         metadata = m.fs.properties.get_metadata().properties
+        on_demand_names = [
+            v.name
+            for v in metadata.list_supported_properties()
+            if metadata[v.name].method is not None
+        ]
 
         # check that properties are not built if not demanded
-        for v in metadata.list_supported_properties():
-            if metadata[v.name].method is not None:
-                if m.fs.stream[0].is_property_constructed(v.name):
-                    raise PropertyAttributeError(
-                        "Property {v_name} is an on-demand property, but was found "
-                        "on the stateblock without being demanded".format(v_name=v.name)
-                    )
+        for v_name in on_demand_names:
+            if m.fs.stream[0].is_property_constructed(v_name):
+                raise PropertyAttributeError(
+                    "Property {v_name} is an on-demand property, but was found "
+                    "on the stateblock without being demanded".format(v_name=v_name)
+                )
 
         # check that properties are built if demanded
-        for v in metadata.list_supported_properties():
-            if metadata[v.name].method is not None:
-                if not hasattr(m.fs.stream[0], v.name):
-                    raise PropertyAttributeError(
-                        "Property {v_name} is an on-demand property, but was not built "
-                        "when demanded".format(v_name=v.name)
-                    )
+        for v_name in on_demand_names:
+            if not hasattr(m.fs.stream[0], v_name):
+                raise PropertyAttributeError(
+                    "Property {v_name} is an on-demand property, but was not built "
+                    "when demanded".format(v_name=v_name)
+                )
 
     @pytest.mark.unit
     def test_stateblock_statistics(self, frame_stateblock):
         m = frame_stateblock
         blk = m.fs.stream[0]
         stats = m._test_objs.stateblock_statistics
-        if number_variables(blk) != stats["number_variables"]:
+        num_vars = number_variables(blk)
+        if num_vars != stats["number_variables"]:
             raise PropertyValueError(
                 "The number of variables were {num}, but {num_test} was "
-                "expected ".format(
-                    num=number_variables(blk), num_test=stats["number_variables"]
-                )
+                "expected ".format(num=num_vars, num_test=stats["number_variables"])
             )
-        if number_total_constraints(blk) != stats["number_total_constraints"]:
+        num_cons = number_total_constraints(blk)
+        if num_cons != stats["number_total_constraints"]:
             raise PropertyValueError(
                 "The number of constraints were {num}, but {num_test} was "
                 "expected ".format(
-                    num=number_total_constraints(blk),
-                    num_test=stats["number_total_constraints"],
+                    num=num_cons, num_test=stats["number_total_constraints"]
                 )
             )
-        if number_unused_variables(blk) != stats["number_unused_variables"]:
+        num_unused = number_unused_variables(blk)
+        if num_unused != stats["number_unused_variables"]:
             raise PropertyValueError(
                 "The number of unused variables were {num}, but {num_test} was "
                 "expected ".format(
-                    num=number_unused_variables(blk),
-                    num_test=stats["number_unused_variables"],
+                    num=num_unused, num_test=stats["number_unused_variables"]
                 )
             )
-        if degrees_of_freedom(blk) != stats["default_degrees_of_freedom"]:
+        dof = degrees_of_freedom(blk)
+        if dof != stats["default_degrees_of_freedom"]:
             raise PropertyValueError(
                 "The number of degrees of freedom were {num}, but {num_test} was "
                 "expected ".format(
-                    num=degrees_of_freedom(blk),
-                    num_test=stats["default_degrees_of_freedom"],
+                    num=dof, num_test=stats["default_degrees_of_freedom"]
                 )
             )
 
@@ -308,22 +312,23 @@ class PropertyTestHarness:
         # check results
         for (v_name, ind), val in m._test_objs.default_solution.items():
             var = getattr(m.fs.stream[0], v_name)[ind]
+            val_t = value(var)
             # relative tolerance doesn't mean anything for 0-valued things
             if val == 0:
-                if not pytest.approx(val, abs=1.0e-08) == value(var):
+                if not pytest.approx(val, abs=1.0e-08) == val_t:
                     raise PropertyValueError(
                         "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 1.0e-08, "
                         "but it has a value of {val_t}. \nUpdate default_solution dict in the "
                         "configure function that sets up the PropertyTestHarness".format(
-                            v_name=v_name, ind=ind, val=val, val_t=value(var)
+                            v_name=v_name, ind=ind, val=val, val_t=val_t
                         )
                     )
-            elif not pytest.approx(val, rel=1e-3) == value(var):
+            elif not pytest.approx(val, rel=1e-3) == val_t:
                 raise PropertyValueError(
                     "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 0.1%, "
                     "but it has a value of {val_t}. \nUpdate default_solution dict in the "
                     "configure function that sets up the PropertyTestHarness".format(
-                        v_name=v_name, ind=ind, val=val, val_t=value(var)
+                        v_name=v_name, ind=ind, val=val, val_t=val_t
                     )
                 )
 
@@ -349,8 +354,7 @@ class PropertyTestHarness:
         fix_state_vars(m.fs.stream)
 
         # solve model
-        opt = get_solver()
-        results = opt.solve(m.fs.stream[0])
+        results = solver.solve(m.fs.stream[0])
         assert_optimal_termination(results)
 
         # check convergence
@@ -360,22 +364,23 @@ class PropertyTestHarness:
         # check results
         for (v_name, ind), val in m._test_objs.default_solution.items():
             var = getattr(m.fs.stream[0], v_name)[ind]
+            val_t = value(var)
             # relative tolerance doesn't mean anything for 0-valued things
             if val == 0:
-                if not pytest.approx(val, abs=1.0e-08) == value(var):
+                if not pytest.approx(val, abs=1.0e-08) == val_t:
                     raise PropertyValueError(
                         "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 1.0e-08, "
                         "but it has a value of {val_t}. \nUpdate default_solution dict in the "
                         "configure function that sets up the PropertyTestHarness".format(
-                            v_name=v_name, ind=ind, val=val, val_t=value(var)
+                            v_name=v_name, ind=ind, val=val, val_t=val_t
                         )
                     )
-            elif not pytest.approx(val, rel=1e-3) == value(var):
+            elif not pytest.approx(val, rel=1e-3) == val_t:
                 raise PropertyValueError(
                     "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 0.1%, "
                     "but it has a value of {val_t}. \nUpdate default_solution dict in the "
                     "configure function that sets up the PropertyTestHarness".format(
-                        v_name=v_name, ind=ind, val=val, val_t=value(var)
+                        v_name=v_name, ind=ind, val=val, val_t=val_t
                     )
                 )
 
@@ -422,24 +427,25 @@ class PropertyTestHarness:
             for sb in [m.fs.cv.properties_in[0], m.fs.cv.properties_out[0]]:
                 if sb.is_property_constructed(v_name):
                     var = getattr(sb, v_name)[ind]  # get property if it was created
+                    val_t = value(var)
                 else:
                     continue
                 # relative tolerance doesn't mean anything for 0-valued things
                 if val == 0:
-                    if not pytest.approx(val, abs=1.0e-08) == value(var):
+                    if not pytest.approx(val, abs=1.0e-08) == val_t:
                         raise PropertyValueError(
                             "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 1.0e-08, "
                             "but it has a value of {val_t}. \nUpdate default_solution dict in the "
                             "configure function that sets up the PropertyTestHarness".format(
-                                v_name=v_name, ind=ind, val=val, val_t=value(var)
+                                v_name=v_name, ind=ind, val=val, val_t=val_t
                             )
                         )
-                elif not pytest.approx(val, rel=1e-3) == value(var):
+                elif not pytest.approx(val, rel=1e-3) == val_t:
                     raise PropertyValueError(
                         "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 0.1%, "
                         "but it has a value of {val_t}. \nUpdate default_solution dict in the "
                         "configure function that sets up the PropertyTestHarness".format(
-                            v_name=v_name, ind=ind, val=val, val_t=value(var)
+                            v_name=v_name, ind=ind, val=val, val_t=val_t
                         )
                     )
 
@@ -509,22 +515,23 @@ class PropertyRegressionTest:
         # check results
         for (v_name, ind), val in self.regression_solution.items():
             var = getattr(m.fs.stream[0], v_name)[ind]
+            val_t = value(var)
             # relative tolerance doesn't mean anything for 0-valued things
             if val == 0:
-                if not pytest.approx(val, abs=1.0e-08) == value(var):
+                if not pytest.approx(val, abs=1.0e-08) == val_t:
                     raise PropertyValueError(
                         "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 1.0e-08, but it "
                         "has a value of {val_t}. \nUpdate regression_solution in the configure function "
                         "that sets up the PropertyRegressionTest".format(
-                            v_name=v_name, ind=ind, val=val, val_t=value(var)
+                            v_name=v_name, ind=ind, val=val, val_t=val_t
                         )
                     )
-            elif not pytest.approx(val, rel=1e-3) == value(var):
+            elif not pytest.approx(val, rel=1e-3) == val_t:
                 raise PropertyValueError(
                     "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 0.1%, but it "
                     "has a value of {val_t}. \nUpdate regression_solution in the configure function "
                     "that sets up the PropertyRegressionTest".format(
-                        v_name=v_name, ind=ind, val=val, val_t=value(var)
+                        v_name=v_name, ind=ind, val=val, val_t=val_t
                     )
                 )
 
@@ -603,22 +610,23 @@ class PropertyCalculateStateTest:
         # check results
         for (v_name, ind), val in self.state_solution.items():
             var = getattr(m.fs.stream[0], v_name)[ind]
+            val_t = value(var)
             # relative tolerance doesn't mean anything for 0-valued things
             if val == 0:
-                if not pytest.approx(val, abs=1.0e-08) == value(var):
+                if not pytest.approx(val, abs=1.0e-08) == val_t:
                     raise PropertyValueError(
                         "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 1.0e-08, but it "
                         "has a value of {val_t}. \nUpdate state_solution in the configure function "
                         "that sets up the PropertyCalculateStateTest".format(
-                            v_name=v_name, ind=ind, val=val, val_t=value(var)
+                            v_name=v_name, ind=ind, val=val, val_t=val_t
                         )
                     )
-            elif not pytest.approx(val, rel=1e-3) == value(var):
+            elif not pytest.approx(val, rel=1e-3) == val_t:
                 raise PropertyValueError(
                     "Variable {v_name} with index {ind} is expected to have a value of {val} +/- 0.1%, but it "
                     "has a value of {val_t}. \nUpdate state_solution in the configure function "
                     "that sets up the PropertyCalculateStateTest".format(
-                        v_name=v_name, ind=ind, val=val, val_t=value(var)
+                        v_name=v_name, ind=ind, val=val, val_t=val_t
                     )
                 )
 
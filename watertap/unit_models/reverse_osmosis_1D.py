@@ -225,13 +225,15 @@ class ReverseOsmosis1DData(ReverseOsmosisBaseData):
             sf = iscale.get_scaling_factor(self.length, default=10, warning=True)
             iscale.set_scaling_factor(self.length, sf)
 
+        length_sf = iscale.get_scaling_factor(self.feed_side.length)
+        nfe = value(self.nfe)
         for (t, x, p, j), v in self.mass_transfer_phase_comp.items():
             sf = (
                 iscale.get_scaling_factor(
                     self.feed_side.properties[t, x].get_material_flow_terms(p, j)
                 )
-                / iscale.get_scaling_factor(self.feed_side.length)
-            ) * value(self.nfe)
+                / length_sf
+            ) * nfe
             if iscale.get_scaling_factor(v) is None:
                 iscale.set_scaling_factor(v, sf)
             v = self.feed_side.mass_transfer_term[t, x, p, j]
@@ -386,8 +386,7 @@ class ReverseOsmosisBaseData(InitializationMixin, UnitModelBlockData):
                 prop_feed = b.feed_side.properties[t, x]
                 prop_perm = b.permeate_side[t, x]
                 interface = b.feed_side.properties_interface[t, x]
-                comp = self.config.property_package.get_component(j)
-                if comp.is_solvent():
+                if j in solvent_set:
                     return b.flux_mass_phase_comp[t, x, p, j] == b.A_comp[
                         t, j
                     ] * b.dens_solvent * (
@@ -397,7 +396,7 @@ class ReverseOsmosisBaseData(InitializationMixin, UnitModelBlockData):
                             - prop_perm.pressure_osm_phase[p]
                         )
                     )
-                elif comp.is_solute():
+                elif j in solute_set:
                     return b.flux_mass_phase_comp[t, x, p, j] == b.B_comp[t, j] * (
                         interface.conc_mass_phase_comp[p, j]
                         - prop_perm.conc_mass_phase_comp[p, j]
@@ -422,8 +421,7 @@ class ReverseOsmosisBaseData(InitializationMixin, UnitModelBlockData):
                 prop_feed = b.feed_side.properties[t, x]
                 prop_perm = b.permeate_side[t, x]
                 interface = b.feed_side.properties_interface[t, x]
-                comp = self.config.property_package.get_component(j)
-                if comp.is_solvent():
+                if j in solvent_set:
                     return b.flux_mass_phase_comp[t, x, p, j] == b.A_comp[
                         t, j
                     ] * b.dens_solvent * (
@@ -434,7 +432,7 @@ class ReverseOsmosisBaseData(InitializationMixin, UnitModelBlockData):
                             - prop_perm.pressure_osm_phase[p]
                         )
                     )
-                elif comp.is_solute():
+                elif j in solute_set:
                     return b.flux_mass_phase_comp[t, x, p, j] == b.B_comp[t, j] * (
                         interface.conc_mass_phase_comp[p, j]
                         - prop_perm.conc_mass_phase_comp[p, j]
@@ -862,19 +860,21 @@ class ReverseOsmosisBaseData(InitializationMixin, UnitModelBlockData):
                 if blk.is_property_constructed("pressure_osm_phase"):
                     self._rescale_permeate_variable(blk.pressure_osm_phase["Liq"])
 
+        solvent_set = self.config.property_package.solvent_set
+        solute_set = self.config.property_package.solute_set
+        dens_solvent_sf = iscale.get_scaling_factor(self.dens_solvent)
         for (t, x, p, j), v in self.flux_mass_phase_comp.items():
             if iscale.get_scaling_factor(v) is None:
-                comp = self.config.property_package.get_component(j)
-                if comp.is_solvent():  # scaling based on solvent flux equation
+                if j in solvent_set:  # scaling based on solvent flux equation
                     sf = (
                         iscale.get_scaling_factor(self.A_comp[t, j])
-                        * iscale.get_scaling_factor(self.dens_solvent)
+                        * dens_solvent_sf
                         * iscale.get_scaling_factor(
                             self.feed_side.properties[t, x].pressure
                         )
                     )
                     iscale.set_scaling_factor(v, sf)
-                elif comp.is_solute():  # scaling based on solute flux equation
+                elif j in solute_set:  # scaling based on solute flux equation
                     sf = iscale.get_scaling_factor(
                         self.B_comp[t, j]
                     ) * iscale.get_scaling_factor(